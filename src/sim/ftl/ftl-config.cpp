@@ -25,6 +25,11 @@ void* mmap_large(std::size_t bytes) {
     if (ptr == MAP_FAILED) {
         throw std::runtime_error("mmap failed");
     }
+#ifdef MADV_HUGEPAGE
+    // Tables are indexed randomly; huge pages cut TLB misses.
+    // Best effort only, so the result is ignored.
+    madvise(ptr, bytes, MADV_HUGEPAGE);
+#endif
     return ptr;
 #endif
 }
@@ -5,10 +5,60 @@
 
 namespace sim::ftl {
 
-// Physical page address – opaque for now.
-// Later you can encode (channel, die, plane, block, page) into this.
+// Physical page address packed into one word:
+//   [63:56] package | [55:48] die | [47:40] plane | [39:16] block | [15:0] page
 using Ppa = std::uint64_t;
 
+// Marks an unmapped table entry (all bits set).
+inline constexpr Ppa kInvalidPpa = ~Ppa{0};
+
+// Field widths of the packed Ppa encoding.
+inline constexpr unsigned kPpaPageBits    = 16;
+inline constexpr unsigned kPpaBlockBits   = 24;
+inline constexpr unsigned kPpaPlaneBits   = 8;
+inline constexpr unsigned kPpaDieBits     = 8;
+inline constexpr unsigned kPpaPackageBits = 8;
+
+inline constexpr unsigned kPpaBlockShift   = kPpaPageBits;
+inline constexpr unsigned kPpaPlaneShift   = kPpaBlockShift + kPpaBlockBits;
+inline constexpr unsigned kPpaDieShift     = kPpaPlaneShift + kPpaPlaneBits;
+inline constexpr unsigned kPpaPackageShift = kPpaDieShift + kPpaDieBits;
+
+static_assert(kPpaPackageShift + kPpaPackageBits == 64,
+              "Ppa fields must fill exactly 64 bits");
+
+// Unpacked view of a Ppa, for when individual fields are needed.
+struct PhysicalAddress {
+    std::uint32_t package;
+    std::uint32_t die;
+    std::uint32_t plane;
+    std::uint32_t block;
+    std::uint32_t page;
+};
+
+constexpr Ppa ppa_field_mask(unsigned bits) {
+    return (Ppa{1} << bits) - 1;
+}
+
+// Encode a physical address. Fields wider than their slot are truncated.
+constexpr Ppa pack_ppa(const PhysicalAddress& a) {
+    return ((Ppa{a.package} & ppa_field_mask(kPpaPackageBits)) << kPpaPackageShift) |
+           ((Ppa{a.die}     & ppa_field_mask(kPpaDieBits))     << kPpaDieShift)     |
+           ((Ppa{a.plane}   & ppa_field_mask(kPpaPlaneBits))   << kPpaPlaneShift)   |
+           ((Ppa{a.block}   & ppa_field_mask(kPpaBlockBits))   << kPpaBlockShift)   |
+            (Ppa{a.page}    & ppa_field_mask(kPpaPageBits));
+}
+
+constexpr PhysicalAddress unpack_ppa(Ppa p) {
+    return PhysicalAddress{
+        static_cast<std::uint32_t>((p >> kPpaPackageShift) & ppa_field_mask(kPpaPackageBits)),
+        static_cast<std::uint32_t>((p >> kPpaDieShift)     & ppa_field_mask(kPpaDieBits)),
+        static_cast<std::uint32_t>((p >> kPpaPlaneShift)   & ppa_field_mask(kPpaPlaneBits)),
+        static_cast<std::uint32_t>((p >> kPpaBlockShift)   & ppa_field_mask(kPpaBlockBits)),
+        static_cast<std::uint32_t>( p                      & ppa_field_mask(kPpaPageBits)),
+    };
+}
+
 // Allocate a large block of virtual memory for big tables.
 void* mmap_large(std::size_t bytes);
 
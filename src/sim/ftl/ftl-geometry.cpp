@@ -1,5 +1,6 @@
 // sim/ftl/ftl-geometry.cpp
 #include <sim/ftl/ftl-geometry.hpp>
+#include <sim/ftl/ftl-config.hpp>
 #include <sim/setup/enums.hpp>
 #include <stdexcept>
 
@@ -38,6 +39,16 @@ SsdGeometry derive_geometry(const sim::setup::SetupConfig& cfg) {
         throw std::invalid_argument("derive_geometry: invalid physical parameters");
     }
 
+    // Every index must fit its Ppa field. Counts are capped at the field
+    // mask, so the largest index stays below it and never forms kInvalidPpa.
+    if (cfg.pages_per_block  > ppa_field_mask(kPpaPageBits)  ||
+        cfg.blocks_per_plane > ppa_field_mask(kPpaBlockBits) ||
+        cfg.planes_per_die   > ppa_field_mask(kPpaPlaneBits) ||
+        cfg.dies_per_package > ppa_field_mask(kPpaDieBits)   ||
+        cfg.packages         > ppa_field_mask(kPpaPackageBits)) {
+        throw std::invalid_argument("derive_geometry: geometry does not fit Ppa encoding");
+    }
+
     SsdGeometry g{};
 
     g.bits_per_cell   = cfg.bits_per_cell;
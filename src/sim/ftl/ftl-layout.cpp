@@ -58,10 +58,9 @@ FtlLayout::FtlLayout(const sim::setup::SetupConfig& c)
 
     base_table = static_cast<Ppa*>(mmap_large(base_bytes));
 
-    // Initialize to an invalid PPA (all bits set)
-    for (std::uint64_t i = 0; i < base_entries; ++i) {
-        base_table[i] = static_cast<Ppa>(~0ULL);
-    }
+    // Initialize to an invalid PPA.
+    // fill_n takes the count by value, so it is not reloaded per store.
+    std::fill_n(base_table, base_entries, kInvalidPpa);
 
     // ---- FAST FTL MAPPING TABLE (hybrid) ----
     if (cfg.fast_ftl_bytes > 0) {
@@ -79,10 +78,8 @@ FtlLayout::FtlLayout(const sim::setup::SetupConfig& c)
             fast_table = nullptr;
             fast_coverage_fraction = 0.0;
         } else {
-            fast_table = new Ppa[fast_entries_allocated];
-            for (std::uint64_t i = 0; i < fast_entries_allocated; ++i) {
-                fast_table[i] = static_cast<Ppa>(~0ULL);
-            }
+            fast_table = static_cast<Ppa*>(mmap_large(fast_bytes));
+            std::fill_n(fast_table, fast_entries_allocated, kInvalidPpa);
             fast_coverage_fraction =
                 static_cast<double>(fast_entries_allocated) /
                 static_cast<double>(fast_entries_requested);
@@ -94,7 +91,9 @@ FtlLayout::~FtlLayout() {
     if (base_table) {
         mmap_free(base_table, base_bytes);
     }
-    delete[] fast_table;
+    if (fast_table) {
+        mmap_free(fast_table, fast_bytes);
+    }
 }
 
 void FtlLayout::print_summary(std::ostream& os) const {
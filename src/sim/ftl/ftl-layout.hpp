@@ -4,7 +4,6 @@
 
 #include <cstddef>
 #include <cstdint>
-#include <iosfwd>
 #include <iostream>
 
 #include <sim/setup/enums.hpp>
@@ -3,13 +3,13 @@
 
 namespace sim::setup {
 
-enum class EccType {
+enum class EccType : std::uint8_t {
     None,
     BCH,
     LDPC
 };
 
-enum class MappingGranularity {
+enum class MappingGranularity : std::uint8_t {
     Block,
     Page,
     SubPage
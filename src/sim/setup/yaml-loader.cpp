@@ -1,5 +1,6 @@
 #include <sim/setup/yaml-loader.hpp>
 #include <yaml-cpp/yaml.h>
+#include <cctype>
 #include <regex>
 #include <stdexcept>
 #include <iostream>
@@ -7,6 +8,11 @@
 
 namespace sim::setup {
 
+static std::string to_upper(std::string s) {
+    for (auto& c : s) c = static_cast<char>(std::toupper(static_cast<unsigned char>(c)));
+    return s;
+}
+
 static uint64_t parse_size_field(const std::string& s) {
     static const std::regex re(R"((\d+)\s*(B|KB|K|KiB|MB|MiB|GB|GiB|TB|TiB)?)",
         std::regex::icase);
@@ -17,9 +23,7 @@ static uint64_t parse_size_field(const std::string& s) {
     }
 
     uint64_t value = std::stoull(m[1]);
-    std::string unit = m[2].str();
-
-    for (auto& c : unit) c = std::toupper(c);
+    std::string unit = to_upper(m[2].str());
 
     if (unit == "" || unit == "B")  return value;
     if (unit == "KB" || unit == "K")   return value * 1000ULL;
@@ -35,8 +39,7 @@ static uint64_t parse_size_field(const std::string& s) {
 }
 
 static EccType parse_ecc(const std::string& s) {
-    std::string up = s;
-    for (auto& c : up) c = std::toupper(c);
+    const std::string up = to_upper(s);
 
     if (up == "NONE") return EccType::None;
     if (up == "BCH")  return EccType::BCH;
@@ -45,8 +48,7 @@ static EccType parse_ecc(const std::string& s) {
 }
 
 static MappingGranularity parse_mapping(const std::string& s) {
-    std::string up = s;
-    for (auto& c : up) c = std::toupper(c);
+    const std::string up = to_upper(s);
 
     if (up == "BLOCK")   return MappingGranularity::Block;
     if (up == "PAGE")    return MappingGranularity::Page;